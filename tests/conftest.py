@@ -0,0 +1,16 @@
+import numpy as np
+import pytest
+
+from textattack.shared import WordEmbedding
+
+
+@pytest.fixture
+def small_word_embedding():
+    """A tiny hand-made word embedding, including a zero vector."""
+    embedding_matrix = np.array(
+        [[1, 0, 0], [1, 1, 0], [0, 0, 0], [-2, 0, 1], [0.5, 2, -1]], dtype=np.float32
+    )
+    words = ["hi", "hello", "zero", "bye", "odd"]
+    word2index = {word: i for i, word in enumerate(words)}
+    index2word = {i: word for i, word in enumerate(words)}
+    return WordEmbedding(embedding_matrix, word2index, index2word)
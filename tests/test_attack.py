@@ -0,0 +1,61 @@
+from textattack.constraints import Constraint
+from textattack.search_methods import SearchMethod
+from textattack.shared import Attack, AttackedText
+from textattack.transformations import Transformation
+
+
+class StubTransformation(Transformation):
+    def _get_transformations(self, current_text, indices_to_modify):
+        return []
+
+
+class StubSearchMethod(SearchMethod):
+    is_black_box = True
+
+    def _perform_search(self, initial_result):
+        return initial_result
+
+
+class AttackAttrsWritingConstraint(Constraint):
+    """Accepts every text, but records an attack attribute on each one it
+    checks, like ``SentenceEncoder`` does with ``similarity_score``."""
+
+    def __init__(self):
+        super().__init__(compare_against_original=False)
+
+    def _check_constraint_many(self, transformed_texts, reference_text):
+        for transformed_text in transformed_texts:
+            transformed_text.attack_attrs["checked"] = True
+        return list(transformed_texts)
+
+    def _check_constraint(self, transformed_text, reference_text):
+        return True
+
+
+def test_filter_transformations_keeps_duplicates():
+    transformation = StubTransformation()
+    attack = Attack(
+        goal_function=object(),
+        constraints=[AttackAttrsWritingConstraint()],
+        transformation=transformation,
+        search_method=StubSearchMethod(),
+    )
+    current_text = AttackedText("a")
+
+    def make_transformed_texts():
+        return [
+            AttackedText(text, attack_attrs={"last_transformation": transformation})
+            for text in ["b", "c", "b", "d", "b", "c"]
+        ]
+
+    filtered_texts = attack.filter_transformations(
+        make_transformed_texts(), current_text
+    )
+    assert [t.text for t in filtered_texts] == ["b", "b", "b", "c", "c", "d"]
+    # Duplicates must carry the attributes written by the constraints.
+    assert all(t.attack_attrs.get("checked") for t in filtered_texts)
+    # Output must not depend on whether results come from the constraints cache.
+    filtered_texts = attack.filter_transformations(
+        make_transformed_texts(), current_text
+    )
+    assert [t.text for t in filtered_texts] == ["b", "b", "b", "c", "c", "d"]
@@ -1,4 +1,5 @@
 import collections
+import pickle
 
 import pytest
 
@@ -193,3 +194,10 @@ class TestAttackedText:
             "farmer's",
             "tan",
         ]
+
+    def test_hash(self, attacked_text):
+        assert hash(attacked_text) == hash(raw_text)
+        # Memoized hash must not be carried across pickling.
+        attacked_text._hash = -1
+        unpickled_text = pickle.loads(pickle.dumps(attacked_text))
+        assert hash(unpickled_text) == hash(raw_text)
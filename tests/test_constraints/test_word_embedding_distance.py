@@ -0,0 +1,100 @@
+import pytest
+
+from textattack.constraints.semantics import WordEmbeddingDistance
+from textattack.shared import AttackedText
+
+
+reference_text = AttackedText("hi hello bye")
+
+
+def make_transformed_texts():
+    return [
+        # hi -> hello: cos_sim 0.71, mse_dist 1
+        AttackedText("hello hello bye", {"newly_modified_indices": {0}}),
+        # hi -> bye: cos_sim -0.89, mse_dist 10
+        AttackedText("bye hello bye", {"newly_modified_indices": {0}}),
+        # bye -> unknown word
+        AttackedText("hi hello foo", {"newly_modified_indices": {2}}),
+        # hi -> hello passes, bye -> odd (cos_sim -0.39, mse_dist 14.25) fails
+        AttackedText("Hello hello odd", {"newly_modified_indices": {0, 2}}),
+        # nothing modified
+        AttackedText("hi hello bye", {"newly_modified_indices": set()}),
+        # hi -> zero vector: cos_sim 0, mse_dist 1
+        AttackedText("zero hello bye", {"newly_modified_indices": {0}}),
+        # hi -> hello passes, hello -> unknown word
+        AttackedText("hello foo bye", {"newly_modified_indices": {0, 1}}),
+    ]
+
+
+def passed_indices(passed_texts, transformed_texts):
+    return [
+        i
+        for i, transformed_text in enumerate(transformed_texts)
+        if any(transformed_text is t for t in passed_texts)
+    ]
+
+
+@pytest.mark.parametrize(
+    "kwargs, expected_passed",
+    [
+        ({"min_cos_sim": 0.5}, [0, 2, 4, 6]),
+        ({"min_cos_sim": 0.5, "include_unknown_words": False}, [0, 4]),
+        ({"max_mse_dist": 1.5}, [0, 2, 4, 5, 6]),
+        ({"max_mse_dist": 1.5, "include_unknown_words": False}, [0, 4, 5]),
+    ],
+)
+def test_check_constraint_many_matches_check_constraint(
+    small_word_embedding, kwargs, expected_passed
+):
+    constraint = WordEmbeddingDistance(embedding=small_word_embedding, **kwargs)
+    transformed_texts = make_transformed_texts()
+    single_passed = [
+        i
+        for i, transformed_text in enumerate(transformed_texts)
+        if constraint._check_constraint(transformed_text, reference_text)
+    ]
+    passed_texts = constraint._check_constraint_many(transformed_texts, reference_text)
+    assert single_passed == expected_passed
+    assert passed_indices(passed_texts, transformed_texts) == expected_passed
+
+
+def test_word_id_cache_is_per_instance(small_word_embedding):
+    constraint = WordEmbeddingDistance(embedding=small_word_embedding, min_cos_sim=0.5)
+    other_constraint = WordEmbeddingDistance(
+        embedding=small_word_embedding, min_cos_sim=0.5
+    )
+    assert constraint._get_word_id("Hello") == 1
+    assert constraint._get_word_id("foo") == -1
+    assert constraint._word_id_cache == {"Hello": 1, "foo": -1}
+    assert other_constraint._word_id_cache == {}
+
+    constraint.clear_cache()
+    assert constraint._word_id_cache == {}
+
+
+@pytest.mark.parametrize("kwargs", [{"min_cos_sim": 0.5}, {"max_mse_dist": 1.5}])
+def test_prepared_reference_text_gives_same_results(small_word_embedding, kwargs):
+    constraint = WordEmbeddingDistance(embedding=small_word_embedding, **kwargs)
+    transformed_texts = make_transformed_texts()
+    unprepared_passed = passed_indices(
+        constraint._check_constraint_many(transformed_texts, reference_text),
+        transformed_texts,
+    )
+
+    constraint.prepare_for(reference_text)
+    assert constraint._prepared_word_ids == [0, 1, 3]
+    prepared_passed = passed_indices(
+        constraint._check_constraint_many(transformed_texts, reference_text),
+        transformed_texts,
+    )
+    assert prepared_passed == unprepared_passed
+    # An equal but distinct reference text must not use the prepared IDs.
+    other_reference_text = AttackedText("hi hello bye")
+    assert passed_indices(
+        constraint._check_constraint_many(transformed_texts, other_reference_text),
+        transformed_texts,
+    ) == unprepared_passed
+
+    constraint.clear_cache()
+    assert constraint._prepared_text is None
+    assert constraint._prepared_word_ids is None
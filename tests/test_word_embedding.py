@@ -13,6 +13,39 @@ def test_embedding_paragramcf():
     assert word_embedding[10 ** 9] is None
 
 
+def test_embedding_distances(small_word_embedding):
+    word_embedding = small_word_embedding
+    matrix = word_embedding.embedding_matrix.astype(np.float64)
+
+    def expected_cos_sim(a, b):
+        norm = np.linalg.norm(matrix[a]) * np.linalg.norm(matrix[b])
+        # Cosine similarity with a zero vector is defined as 0.
+        return 0.0 if norm == 0 else np.dot(matrix[a], matrix[b]) / norm
+
+    def expected_mse_dist(a, b):
+        return np.sum((matrix[a] - matrix[b]) ** 2)
+
+    num_words = len(matrix)
+    a_ids = [a for a in range(num_words) for b in range(num_words)]
+    b_ids = [b for a in range(num_words) for b in range(num_words)]
+    expected_cos_sims = [expected_cos_sim(a, b) for a, b in zip(a_ids, b_ids)]
+    expected_mse_dists = [expected_mse_dist(a, b) for a, b in zip(a_ids, b_ids)]
+
+    cos_sims = [word_embedding.get_cos_sim(a, b) for a, b in zip(a_ids, b_ids)]
+    mse_dists = [word_embedding.get_mse_dist(a, b) for a, b in zip(a_ids, b_ids)]
+    assert cos_sims == pytest.approx(expected_cos_sims, abs=1e-5)
+    assert mse_dists == pytest.approx(expected_mse_dists, abs=1e-5)
+    assert list(word_embedding.get_cos_sim_many(a_ids, b_ids)) == pytest.approx(
+        expected_cos_sims, abs=1e-5
+    )
+    assert list(word_embedding.get_mse_dist_many(a_ids, b_ids)) == pytest.approx(
+        expected_mse_dists, abs=1e-5
+    )
+    # Words can be passed instead of IDs.
+    assert word_embedding.get_cos_sim("hi", "hello") == pytest.approx(1 / np.sqrt(2))
+    assert word_embedding.get_mse_dist("zero", "bye") == pytest.approx(5)
+
+
 def test_embedding_gensim():
     # download a trained word2vec model
     from textattack.shared.utils.install import TEXTATTACK_CACHE_DIR
@@ -37,6 +70,11 @@ bye-bye -1 1
     assert pytest.approx(word_embedding.get_cos_sim(1, 3)) == 0
     # mse dist
     assert pytest.approx(word_embedding.get_mse_dist(0, 2)) == 4
+    # batched queries
+    assert list(word_embedding.get_cos_sim_many([1, 0], [3, 1])) == pytest.approx(
+        [0, 1 / np.sqrt(2)]
+    )
+    assert list(word_embedding.get_mse_dist_many([0], [2])) == pytest.approx([4])
     # nearest neighbour of hi is hello
     assert word_embedding.nearest_neighbours(0, 1)[0] == 1
     assert word_embedding.word2index("bye") == 2
@@ -5,7 +5,6 @@ Sentence Encoder Class
 
 import math
 
-import numpy as np
 import torch
 
 from textattack.constraints import Constraint
@@ -186,8 +185,12 @@ class SentenceEncoder(Constraint):
             ):
                 scores[i] = 1
             transformed_text.attack_attrs["similarity_score"] = scores[i].item()
-        mask = (scores >= self.threshold).cpu().numpy().nonzero()
-        return np.array(transformed_texts)[mask]
+        mask = (scores >= self.threshold).cpu().numpy()
+        return [
+            transformed_text
+            for transformed_text, passed in zip(transformed_texts, mask)
+            if passed
+        ]
 
     def _check_constraint(self, transformed_text, reference_text):
         if (
@@ -3,6 +3,8 @@ Word Embedding Distance
 --------------------------
 """
 
+import numpy as np
+
 from textattack.constraints import Constraint
 from textattack.shared import AbstractWordEmbedding, WordEmbedding
 from textattack.shared.validators import transformation_consists_of_word_swaps
@@ -39,6 +41,11 @@ class WordEmbeddingDistance(Constraint):
             raise ValueError("You must choose either `min_cos_sim` or `max_mse_dist`.")
         self.min_cos_sim = min_cos_sim
         self.max_mse_dist = max_mse_dist
+        # Bind the check for the chosen metric once instead of branching per call.
+        if self.min_cos_sim:
+            self._get_violations = self._get_cos_sim_violations
+        else:
+            self._get_violations = self._get_mse_dist_violations
 
         if not isinstance(embedding, AbstractWordEmbedding):
             raise ValueError(
@@ -46,6 +53,12 @@ class WordEmbeddingDistance(Constraint):
             )
         self.embedding = embedding
 
+        # Embedding IDs of words seen during the current attack.
+        self._word_id_cache = {}
+        # Embedding IDs of the words of the text passed to `prepare_for`.
+        self._prepared_text = None
+        self._prepared_word_ids = None
+
     def get_cos_sim(self, a, b):
         """Returns the cosine similarity of words with IDs a and b."""
         return self.embedding.get_cos_sim(a, b)
@@ -54,46 +67,133 @@ class WordEmbeddingDistance(Constraint):
         """Returns the MSE distance of words with IDs a and b."""
         return self.embedding.get_mse_dist(a, b)
 
-    def _check_constraint(self, transformed_text, reference_text):
-        """Returns true if (``transformed_text`` and ``reference_text``) are
-        closer than ``self.min_cos_sim`` or ``self.max_mse_dist``."""
+    def _get_word_id(self, word):
+        """Returns the embedding ID of ``word``, or -1 if it has none."""
         try:
-            indices = transformed_text.attack_attrs["newly_modified_indices"]
+            return self._word_id_cache[word]
         except KeyError:
+            pass
+        if self.cased:
+            lookup_word = word
+        else:
+            # If embedding vocabulary is all lowercase, lowercase words.
+            lookup_word = word.lower()
+        try:
+            word_id = self.embedding.word2index(lookup_word)
+        except KeyError:
+            word_id = -1
+        self._word_id_cache[word] = word_id
+        return word_id
+
+    def prepare_for(self, attacked_text):
+        """Resolves the embedding IDs of all words of ``attacked_text`` once,
+        so that they are not looked up again for every candidate compared
+        against it.
+
+        Called by ``Attack`` with the original text of each attack.
+        """
+        self._prepared_text = attacked_text
+        self._prepared_word_ids = [
+            self._get_word_id(word) for word in attacked_text.words
+        ]
+
+    def clear_cache(self):
+        self._word_id_cache.clear()
+        self._prepared_text = None
+        self._prepared_word_ids = None
+
+    def _get_modified_word_ids(self, transformed_text, reference_text):
+        """Returns the embedding IDs of the words of ``reference_text`` and
+        ``transformed_text`` at each newly modified index of
+        ``transformed_text``, or ``None`` if an unknown word makes the
+        constraint fail."""
+        indices = transformed_text.attack_attrs.get("newly_modified_indices")
+        if indices is None:
             raise KeyError(
                 "Cannot apply part-of-speech constraint without `newly_modified_indices`"
             )
+        if not indices:
+            return [], []
 
-        for i in indices:
-            ref_word = reference_text.words[i]
-            transformed_word = transformed_text.words[i]
-
-            if not self.cased:
-                # If embedding vocabulary is all lowercase, lowercase words.
-                ref_word = ref_word.lower()
-                transformed_word = transformed_word.lower()
-
-            try:
-                ref_id = self.embedding.word2index(ref_word)
-                transformed_id = self.embedding.word2index(transformed_word)
-            except KeyError:
-                # This error is thrown if x or x_adv has no corresponding ID.
-                if self.include_unknown_words:
-                    continue
-                return False
-
-            # Check cosine distance.
-            if self.min_cos_sim:
-                cos_sim = self.get_cos_sim(ref_id, transformed_id)
-                if cos_sim < self.min_cos_sim:
-                    return False
-            # Check MSE distance.
-            if self.max_mse_dist:
-                mse_dist = self.get_mse_dist(ref_id, transformed_id)
-                if mse_dist > self.max_mse_dist:
-                    return False
-
-        return True
+        get_word_id = self._get_word_id
+        if reference_text is self._prepared_text:
+            prepared_word_ids = self._prepared_word_ids
+            ref_ids = [prepared_word_ids[i] for i in indices]
+        else:
+            reference_words = reference_text.words
+            ref_ids = [get_word_id(reference_words[i]) for i in indices]
+        transformed_words = transformed_text.words
+        transformed_ids = [get_word_id(transformed_words[i]) for i in indices]
+
+        if -1 in ref_ids or -1 in transformed_ids:
+            # x or x_adv has no corresponding ID.
+            if not self.include_unknown_words:
+                return None
+            known_pairs = [
+                (ref_id, transformed_id)
+                for ref_id, transformed_id in zip(ref_ids, transformed_ids)
+                if ref_id >= 0 and transformed_id >= 0
+            ]
+            ref_ids = [ref_id for ref_id, _ in known_pairs]
+            transformed_ids = [transformed_id for _, transformed_id in known_pairs]
+
+        return ref_ids, transformed_ids
+
+    def _get_cos_sim_violations(self, ref_ids, transformed_ids):
+        """Returns a boolean array marking which word pairs have a cosine
+        similarity below ``self.min_cos_sim``."""
+        cos_sims = self.embedding.get_cos_sim_many(ref_ids, transformed_ids)
+        return cos_sims < self.min_cos_sim
+
+    def _get_mse_dist_violations(self, ref_ids, transformed_ids):
+        """Returns a boolean array marking which word pairs have an MSE
+        distance above ``self.max_mse_dist``."""
+        mse_dists = self.embedding.get_mse_dist_many(ref_ids, transformed_ids)
+        return mse_dists > self.max_mse_dist
+
+    def _check_constraint_many(self, transformed_texts, reference_text):
+        """Filters ``transformed_texts`` to those whose modified words are all
+        close enough to the words in ``reference_text``.
+
+        Word pairs of every transformed text are gathered and compared
+        with a single batched query to ``self.embedding``.
+        """
+        candidate_texts = []
+        ref_ids = []
+        transformed_ids = []
+        owners = []
+        for transformed_text in transformed_texts:
+            word_ids = self._get_modified_word_ids(transformed_text, reference_text)
+            if word_ids is None:
+                continue
+            owners.extend([len(candidate_texts)] * len(word_ids[0]))
+            candidate_texts.append(transformed_text)
+            ref_ids.extend(word_ids[0])
+            transformed_ids.extend(word_ids[1])
+
+        if not ref_ids:
+            return candidate_texts
+
+        violations = self._get_violations(ref_ids, transformed_ids)
+        num_violations = np.bincount(
+            owners, weights=violations, minlength=len(candidate_texts)
+        )
+        return [
+            transformed_text
+            for transformed_text, n in zip(candidate_texts, num_violations)
+            if not n
+        ]
+
+    def _check_constraint(self, transformed_text, reference_text):
+        """Returns true if (``transformed_text`` and ``reference_text``) are
+        closer than ``self.min_cos_sim`` or ``self.max_mse_dist``."""
+        word_ids = self._get_modified_word_ids(transformed_text, reference_text)
+        if word_ids is None:
+            return False
+        ref_ids, transformed_ids = word_ids
+        if not ref_ids:
+            return True
+        return not self._get_violations(ref_ids, transformed_ids).any()
 
     def check_compatibility(self, transformation):
         """WordEmbeddingDistance requires a word being both deleted and
@@ -11,6 +11,7 @@ The ``Attack`` class represents an adversarial attack composed of a goal functio
 """
 
 from collections import deque
+from operator import attrgetter
 
 import lru
 
@@ -166,13 +167,10 @@ class Attack:
 
         if self.use_transformation_cache:
             cache_key = tuple([current_text] + sorted(kwargs.items()))
-            if utils.hashable(cache_key) and cache_key in self.transformation_cache:
-                # promote transformed_text to the top of the LRU cache
-                self.transformation_cache[cache_key] = self.transformation_cache[
-                    cache_key
-                ]
+            try:
+                # Lookups promote the key to the top of the LRU cache.
                 transformed_texts = list(self.transformation_cache[cache_key])
-            else:
+            except (KeyError, TypeError):
                 transformed_texts = self._get_transformations_uncached(
                     current_text, original_text, **kwargs
                 )
@@ -211,12 +209,12 @@ class Attack:
                 filtered_texts = C.call_many(filtered_texts, original_text)
             else:
                 filtered_texts = C.call_many(filtered_texts, current_text)
-        # Default to false for all original transformations.
-        for original_transformed_text in transformed_texts:
-            self.constraints_cache[(current_text, original_transformed_text)] = False
-        # Set unfiltered transformations to True in the cache.
-        for filtered_text in filtered_texts:
-            self.constraints_cache[(current_text, filtered_text)] = True
+        # Cache whether each original transformation passed the constraints.
+        passed_texts = set(filtered_texts)
+        for transformed_text in transformed_texts:
+            self.constraints_cache[(current_text, transformed_text)] = (
+                transformed_text in passed_texts
+            )
         return filtered_texts
 
     def filter_transformations(
@@ -235,24 +233,48 @@ class Attack:
         transformed_texts = [
             t for t in transformed_texts if t.text != current_text.text
         ]
+        # Probe the cache and check constraints once per distinct transformed text.
+        # Duplicates are tracked by position, since constraints may write to the
+        # ``attack_attrs`` of a checked text and make it compare unequal to its copies.
+        representatives = {}
+        representative_texts = []
+        unique_texts = []
+        for transformed_text in transformed_texts:
+            representative = representatives.setdefault(
+                transformed_text, transformed_text
+            )
+            if representative is transformed_text:
+                unique_texts.append(transformed_text)
+            representative_texts.append(representative)
         # Populate cache with transformed_texts
         uncached_texts = []
         filtered_texts = []
-        for transformed_text in transformed_texts:
-            if (current_text, transformed_text) not in self.constraints_cache:
-                uncached_texts.append(transformed_text)
-            else:
-                # promote transformed_text to the top of the LRU cache
-                self.constraints_cache[
+        for transformed_text in unique_texts:
+            try:
+                # Lookups promote transformed_text to the top of the LRU cache.
+                passed_constraints = self.constraints_cache[
                     (current_text, transformed_text)
-                ] = self.constraints_cache[(current_text, transformed_text)]
-                if self.constraints_cache[(current_text, transformed_text)]:
-                    filtered_texts.append(transformed_text)
+                ]
+            except KeyError:
+                uncached_texts.append(transformed_text)
+                continue
+            if passed_constraints:
+                filtered_texts.append(transformed_text)
         filtered_texts += self._filter_transformations_uncached(
             uncached_texts, current_text, original_text=original_text
         )
+        if len(unique_texts) < len(transformed_texts):
+            # Restore the duplicates of texts that passed the constraints. Each
+            # duplicate is replaced by its checked representative so that it carries
+            # any ``attack_attrs`` the constraints wrote.
+            passed_ids = set(map(id, filtered_texts))
+            filtered_texts = [
+                representative
+                for representative in representative_texts
+                if id(representative) in passed_ids
+            ]
         # Sort transformations to ensure order is preserved between runs
-        filtered_texts.sort(key=lambda t: t.text)
+        filtered_texts.sort(key=attrgetter("text"))
         return filtered_texts
 
     def attack_one(self, initial_result):
@@ -266,6 +288,9 @@ class Attack:
             A ``SuccessfulAttackResult``, ``FailedAttackResult``,
                 or ``MaximizedAttackResult``.
         """
+        for constraint in self.constraints:
+            if hasattr(constraint, "prepare_for"):
+                constraint.prepare_for(initial_result.attacked_text)
         final_result = self.search_method(initial_result)
         self.clear_cache()
         if final_result.goal_status == GoalFunctionResultStatus.SUCCEEDED:
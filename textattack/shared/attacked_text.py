@@ -57,6 +57,7 @@ class AttackedText:
         self._words_per_input = None
         self._pos_tags = None
         self._ner_tags = None
+        self._hash = None
         # Format text inputs.
         self._text_input = OrderedDict([(k, v) for k, v in self._text_input.items()])
         if attack_attrs is None:
@@ -94,7 +95,15 @@ class AttackedText:
         return True
 
     def __hash__(self):
-        return hash(self.text)
+        # ``self.text`` is rebuilt on every access, so memoize its hash.
+        if self._hash is None:
+            self._hash = hash(self.text)
+        return self._hash
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        # String hashes are salted per process, so never reuse a pickled hash.
+        self._hash = None
 
     def free_memory(self):
         """Delete items that take up memory.
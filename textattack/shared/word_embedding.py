@@ -6,7 +6,6 @@ Shared loads word embeddings and related distances
 from abc import ABC, abstractmethod
 from collections import defaultdict
 import os
-import pickle
 
 import numpy as np
 import torch
@@ -63,6 +62,32 @@ class AbstractWordEmbedding(ABC):
         """
         raise NotImplementedError()
 
+    def get_mse_dist_many(self, a_ids, b_ids):
+        """Return MSE distances between each pair of vectors for words in
+        `a_ids` and `b_ids`.
+
+        Subclasses may override this with a vectorized implementation. By default, `get_mse_dist` is called for each pair.
+        Args:
+            a_ids (list[int]): IDs of the first word of each pair
+            b_ids (list[int]): IDs of the second word of each pair
+        Returns:
+            distances (ndarray): 1-D array of MSE (L2) distances
+        """
+        return np.array([self.get_mse_dist(a, b) for a, b in zip(a_ids, b_ids)])
+
+    def get_cos_sim_many(self, a_ids, b_ids):
+        """Return cosine similarities between each pair of vectors for words
+        in `a_ids` and `b_ids`.
+
+        Subclasses may override this with a vectorized implementation. By default, `get_cos_sim` is called for each pair.
+        Args:
+            a_ids (list[int]): IDs of the first word of each pair
+            b_ids (list[int]): IDs of the second word of each pair
+        Returns:
+            similarities (ndarray): 1-D array of cosine similarities
+        """
+        return np.array([self.get_cos_sim(a, b) for a, b in zip(a_ids, b_ids)])
+
     @abstractmethod
     def word2index(self, word):
         """
@@ -123,9 +148,16 @@ class WordEmbedding(AbstractWordEmbedding):
         self._index2word = index2word
         self.nn_matrix = nn_matrix
 
+        # Precompute unit-length vectors so cosine similarity is a single dot product,
+        # and norms so MSE distance can be derived from that same dot product. Queries
+        # touch only a few vectors and feed threshold checks, so the tables are kept
+        # as float32 numpy arrays: narrow rows and no host-device transfers per query.
+        norms = np.linalg.norm(embedding_matrix, axis=1)
+        self._norms = norms.astype(np.float32)
+        norms[norms == 0] = 1
+        self._normalized_matrix = (embedding_matrix / norms[:, None]).astype(np.float32)
+
         # Dictionary for caching results
-        self._mse_dist_mat = defaultdict(dict)
-        self._cos_sim_mat = defaultdict(dict)
         self._nn_cache = {}
 
     def __getitem__(self, index):
@@ -182,18 +214,18 @@ class WordEmbedding(AbstractWordEmbedding):
             a = self._word2index[a]
         if isinstance(b, str):
             b = self._word2index[b]
-        a, b = min(a, b), max(a, b)
-        try:
-            mse_dist = self._mse_dist_mat[a][b]
-        except KeyError:
-            e1 = self.embedding_matrix[a]
-            e2 = self.embedding_matrix[b]
-            e1 = torch.tensor(e1).to(utils.device)
-            e2 = torch.tensor(e2).to(utils.device)
-            mse_dist = torch.sum((e1 - e2) ** 2).item()
-            self._mse_dist_mat[a][b] = mse_dist
+        cos_sim = np.dot(self._normalized_matrix[a], self._normalized_matrix[b])
+        mse_dist = self._mse_dist_from_cos_sim(cos_sim, self._norms[a], self._norms[b])
+        return max(float(mse_dist), 0.0)
 
-        return mse_dist
+    @staticmethod
+    def _mse_dist_from_cos_sim(cos_sim, norm_a, norm_b):
+        """Computes ||a - b||^2 = (|a| - |b|)^2 + 2|a||b|(1 - cos(a, b)), so
+        MSE distance reuses the cosine similarity and only reads norms.
+
+        The result may be slightly negative due to floating point error.
+        """
+        return (norm_a - norm_b) ** 2 + 2.0 * norm_a * norm_b * (1.0 - cos_sim)
 
     def get_cos_sim(self, a, b):
         """Return cosine similarity between vector for word `a` and vector for
@@ -210,17 +242,37 @@ class WordEmbedding(AbstractWordEmbedding):
             a = self._word2index[a]
         if isinstance(b, str):
             b = self._word2index[b]
-        a, b = min(a, b), max(a, b)
-        try:
-            cos_sim = self._cos_sim_mat[a][b]
-        except KeyError:
-            e1 = self.embedding_matrix[a]
-            e2 = self.embedding_matrix[b]
-            e1 = torch.tensor(e1).to(utils.device)
-            e2 = torch.tensor(e2).to(utils.device)
-            cos_sim = torch.nn.CosineSimilarity(dim=0)(e1, e2).item()
-            self._cos_sim_mat[a][b] = cos_sim
-        return cos_sim
+        return float(np.dot(self._normalized_matrix[a], self._normalized_matrix[b]))
+
+    def get_mse_dist_many(self, a_ids, b_ids):
+        """Return MSE distances between each pair of vectors for words in
+        `a_ids` and `b_ids`.
+
+        Args:
+            a_ids (list[int]): IDs of the first word of each pair
+            b_ids (list[int]): IDs of the second word of each pair
+        Returns:
+            distances (ndarray): 1-D array of MSE (L2) distances
+        """
+        cos_sims = self.get_cos_sim_many(a_ids, b_ids)
+        mse_dists = self._mse_dist_from_cos_sim(
+            cos_sims, self._norms[a_ids], self._norms[b_ids]
+        )
+        return np.maximum(mse_dists, 0.0)
+
+    def get_cos_sim_many(self, a_ids, b_ids):
+        """Return cosine similarities between each pair of vectors for words
+        in `a_ids` and `b_ids`.
+
+        Args:
+            a_ids (list[int]): IDs of the first word of each pair
+            b_ids (list[int]): IDs of the second word of each pair
+        Returns:
+            similarities (ndarray): 1-D array of cosine similarities
+        """
+        return (self._normalized_matrix[a_ids] * self._normalized_matrix[b_ids]).sum(
+            axis=1
+        )
 
     def nearest_neighbours(self, index, topn):
         """
@@ -266,8 +318,6 @@ class WordEmbedding(AbstractWordEmbedding):
         word_embeddings_folder = "paragramcf"
         word_embeddings_file = "paragram.npy"
         word_list_file = "wordlist.pickle"
-        mse_dist_file = "mse_dist.p"
-        cos_sim_file = "cos_sim.p"
         nn_matrix_file = "nn.npy"
 
         # Download embeddings if they're not cached.
@@ -280,8 +330,6 @@ class WordEmbedding(AbstractWordEmbedding):
             word_embeddings_folder, word_embeddings_file
         )
         word_list_file = os.path.join(word_embeddings_folder, word_list_file)
-        mse_dist_file = os.path.join(word_embeddings_folder, mse_dist_file)
-        cos_sim_file = os.path.join(word_embeddings_folder, cos_sim_file)
         nn_matrix_file = os.path.join(word_embeddings_folder, nn_matrix_file)
 
         # loading the files
@@ -294,14 +342,6 @@ class WordEmbedding(AbstractWordEmbedding):
 
         embedding = WordEmbedding(embedding_matrix, word2index, index2word, nn_matrix)
 
-        with open(mse_dist_file, "rb") as f:
-            mse_dist_mat = pickle.load(f)
-        with open(cos_sim_file, "rb") as f:
-            cos_sim_mat = pickle.load(f)
-
-        embedding._mse_dist_mat = mse_dist_mat
-        embedding._cos_sim_mat = cos_sim_mat
-
         utils.GLOBAL_OBJECTS["textattack_counterfitted_GLOVE_embedding"] = embedding
 
         return embedding
@@ -397,9 +437,7 @@ class GensimWordEmbedding(AbstractWordEmbedding):
         except KeyError:
             e1 = self.keyed_vectors.vectors_norm[a]
             e2 = self.keyed_vectors.vectors_norm[b]
-            e1 = torch.tensor(e1).to(utils.device)
-            e2 = torch.tensor(e2).to(utils.device)
-            mse_dist = torch.sum((e1 - e2) ** 2).item()
+            mse_dist = float(np.sum((e1 - e2) ** 2))
             self._mse_dist_mat[a][b] = mse_dist
         return mse_dist
 